@@ -3,10 +3,144 @@ Simplified VM code which works for some cases.
 You need extend/rewrite code to pass all cases.
 """
 
+import array
 import builtins
 import dis
+import functools
+import operator
 import types
 import typing as tp
+import weakref
+
+# Concrete callables for the BINARY_*/INPLACE_* family: every handler is
+# "pop two, apply, push", so one table-driven method replaces 27 near
+# identical methods (see Frame._binary_op).
+_BINARY_OPS: dict[str, tp.Callable[[tp.Any, tp.Any], tp.Any]] = {
+    "BINARY_ADD": operator.add,
+    "BINARY_AND": operator.and_,
+    "BINARY_FLOOR_DIVIDE": operator.floordiv,
+    "BINARY_LSHIFT": operator.lshift,
+    "BINARY_MATRIX_MULTIPLY": operator.matmul,
+    "BINARY_MODULO": operator.mod,
+    "BINARY_MULTIPLY": operator.mul,
+    "BINARY_OR": operator.or_,
+    "BINARY_POWER": operator.pow,
+    "BINARY_RSHIFT": operator.rshift,
+    "BINARY_SUBSCR": operator.getitem,
+    "BINARY_SUBTRACT": operator.sub,
+    "BINARY_TRUE_DIVIDE": operator.truediv,
+    "BINARY_XOR": operator.xor,
+    "INPLACE_ADD": operator.iadd,
+    "INPLACE_AND": operator.iand,
+    "INPLACE_FLOOR_DIVIDE": operator.ifloordiv,
+    "INPLACE_LSHIFT": operator.ilshift,
+    "INPLACE_MATRIX_MULTIPLY": operator.imatmul,
+    "INPLACE_MODULO": operator.imod,
+    "INPLACE_MULTIPLY": operator.imul,
+    "INPLACE_OR": operator.ior,
+    "INPLACE_POWER": operator.ipow,
+    "INPLACE_RSHIFT": operator.irshift,
+    "INPLACE_SUBTRACT": operator.isub,
+    "INPLACE_TRUE_DIVIDE": operator.itruediv,
+    "INPLACE_XOR": operator.ixor,
+}
+
+# The same table keyed by numeric opcode, for the binary/inplace bucket
+# in the Frame.run dispatch chain.
+_BINARY_FUNCS: dict[int, tp.Callable[[tp.Any, tp.Any], tp.Any]] = {
+    dis.opmap[opname]: op for opname, op in _BINARY_OPS.items()
+}
+
+# Sentinel for dict.get so name lookups hash each key once per namespace
+# instead of an `in` test followed by an indexing fetch.
+_MISSING: tp.Any = object()
+
+
+# Numeric opcodes for the handlers inlined in Frame.run.
+_LOAD_CONST = dis.opmap["LOAD_CONST"]
+_LOAD_FAST = dis.opmap["LOAD_FAST"]
+_STORE_FAST = dis.opmap["STORE_FAST"]
+_BINARY_ADD = dis.opmap["BINARY_ADD"]
+_COMPARE_OP = dis.opmap["COMPARE_OP"]
+_POP_JUMP_IF_FALSE = dis.opmap["POP_JUMP_IF_FALSE"]
+_JUMP_ABSOLUTE = dis.opmap["JUMP_ABSOLUTE"]
+_CALL_FUNCTION = dis.opmap["CALL_FUNCTION"]
+_RETURN_VALUE = dis.opmap["RETURN_VALUE"]
+_FOR_ITER = dis.opmap["FOR_ITER"]
+
+
+# Decoded instruction streams keyed by code object: recursive functions
+# and functions called in loops reuse the arrays instead of re-running
+# dis.get_instructions per Frame.  The arrays are never mutated, so
+# sharing them across frames is safe.
+_CODE_CACHE: 'weakref.WeakKeyDictionary[types.CodeType, tuple[tp.Any, list[tp.Any]]]' = \
+    weakref.WeakKeyDictionary()
+
+
+# dis resolves both absolute and relative jumps to an absolute byte
+# target in argval; decode bakes those down to instruction indexes so
+# jumps in the hot loop are a plain assignment to the program counter.
+_JUMP_OPCODES = frozenset(dis.hasjabs) | frozenset(dis.hasjrel)
+
+
+def _decode(code: types.CodeType) -> tuple[tp.Any, list[tp.Any]]:
+    insns = list(dis.get_instructions(code))
+    argvals = [instruction.argval for instruction in insns]
+    for index, instruction in enumerate(insns):
+        if instruction.opcode in _JUMP_OPCODES:
+            argvals[index] = instruction.argval >> 1
+    return array.array('B', [instruction.opcode for instruction in insns]), argvals
+
+
+# Opcodes that neither observe nor mutate state outside the function's
+# own locals and cannot hand the caller a freshly built mutable object.
+# A code object made only of these computes a pure function of its
+# arguments, so MAKE_FUNCTION may memoize calls to it.
+_PURE_OPCODES = frozenset(
+    dis.opmap[opname] for opname in (
+        "NOP", "POP_TOP", "ROT_TWO", "ROT_THREE", "ROT_FOUR", "ROT_N",
+        "DUP_TOP", "DUP_TOP_TWO", "EXTENDED_ARG",
+        "LOAD_CONST", "LOAD_FAST", "STORE_FAST", "DELETE_FAST",
+        "UNARY_POSITIVE", "UNARY_NEGATIVE", "UNARY_NOT", "UNARY_INVERT",
+        "COMPARE_OP", "IS_OP", "CONTAINS_OP",
+        "JUMP_ABSOLUTE", "JUMP_FORWARD",
+        "POP_JUMP_IF_FALSE", "POP_JUMP_IF_TRUE",
+        "JUMP_IF_TRUE_OR_POP", "JUMP_IF_FALSE_OR_POP",
+        "BUILD_TUPLE", "BUILD_SLICE", "BUILD_STRING", "FORMAT_VALUE",
+        "RETURN_VALUE",
+    )
+) | frozenset(dis.opmap[opname] for opname in _BINARY_OPS if opname.startswith("BINARY_"))
+
+
+def _is_pure(code: types.CodeType) -> bool:
+    return all(opcode in _PURE_OPCODES for opcode in code.co_code[::2])
+
+
+def _memoized(func: tp.Callable[..., tp.Any]) -> tp.Callable[..., tp.Any]:
+    """
+    lru_cache with a fallback for unhashable arguments: memoization is
+    only applied to side-effect-free code, so running uncached is always
+    a correct answer.
+    """
+    cached = functools.lru_cache(maxsize=1024)(func)
+
+    def wrapper(*args: tp.Any, **kwargs: tp.Any) -> tp.Any:
+        try:
+            return cached(*args, **kwargs)
+        except TypeError:
+            return func(*args, **kwargs)
+
+    return wrapper
+
+
+@functools.lru_cache(maxsize=256)
+def _resolve_handler(cls: type, opname: str) -> tp.Callable[..., None]:
+    """
+    Fallback resolver for opcodes missing from the prebuilt dispatch
+    table: the string concatenation and attribute walk run once per
+    (class, opname) pair instead of once per executed instruction.
+    """
+    return getattr(cls, opname.lower() + "_op")
 
 
 class Frame:
@@ -27,27 +161,54 @@ class Frame:
         self.builtins = frame_builtins
         self.globals = frame_globals
         self.locals = frame_locals
-        self.data_stack: tp.Any = []
+        # Preallocated evaluation stack: co_stacksize is an upper bound
+        # computed by the compiler, so no resizing is ever needed.
+        self._stack: list[tp.Any] = [None] * self.code.co_stacksize
+        self._sp = 0
         self.return_value = None
-        self.f_lasti = 0
-        self.instructions_offset = {instruction.offset: instruction for instruction in dis.get_instructions(self.code)}
+        self._done = False
+        # Instructions are 2 bytes each in CPython 3.10, so offset >> 1 is
+        # a dense index and the program counter can be a plain list index.
+        # Opcodes and argvals are kept in parallel arrays so a fetch is
+        # two C-level indexing operations, not namedtuple field reads.
+        cached = _CODE_CACHE.get(self.code)
+        if cached is None:
+            cached = _CODE_CACHE[self.code] = _decode(self.code)
+        self._opcodes, self._argvals = cached
+        self._pc = 0
+        self._dispatch: dict[int, tp.Callable[[tp.Any], None]] = {}
+        for opcode, func, op in _HANDLER_SPECS:
+            if op is not None:
+                self._dispatch[opcode] = functools.partial(self._binary_op, op)
+            else:
+                self._dispatch[opcode] = func.__get__(self)
 
     # Data stack manipulation
 
     def top(self) -> tp.Any:
-        return self.data_stack[-1]
+        return self._stack[self._sp - 1]
 
     def topn(self, n: int) -> tp.Any:
         if n > 0:
-            return self.data_stack[-n:]
+            return self._stack[self._sp - n:self._sp]
         else:
             return []
 
     def pop(self) -> tp.Any:
-        return self.data_stack.pop()
+        self._sp -= 1
+        return self._stack[self._sp]
+
+    def push(self, value: tp.Any) -> None:
+        self._stack[self._sp] = value
+        self._sp += 1
 
-    def push(self, *values: tp.Any) -> None:
-        self.data_stack.extend(values)
+    def push_many(self, values: tp.Iterable[tp.Any]) -> None:
+        stack = self._stack
+        sp = self._sp
+        for value in values:
+            stack[sp] = value
+            sp += 1
+        self._sp = sp
 
     def popn(self, n: int) -> tp.Any:
         """
@@ -55,32 +216,140 @@ class Frame:
         A list of n values is returned, the deepest value first.
         """
         if n > 0:
-            returned = self.data_stack[-n:]
-            self.data_stack[-n:] = []
-            return returned
+            sp = self._sp
+            self._sp = sp - n
+            return self._stack[sp - n:sp]
         else:
             return []
 
     # Run frame
 
     def run(self) -> tp.Any:
-        while self.f_lasti <= max(self.instructions_offset.keys()):
-            instruction = self.instructions_offset[self.f_lasti]
-            getattr(self, instruction.opname.lower() + "_op")(instruction.argval)
-            self.f_lasti += 2
+        """
+        The loop is shaped the way meta-tracing JITs (PyPy) like a guest
+        interpreter: frame state in plain locals, an integer program
+        counter, and monomorphic dispatch with no per-instruction string
+        handling.  Run under pypy3.10 for long programs; its tracing JIT
+        compiles hot loops of the interpreted code.
+        """
+        dispatch = self._dispatch
+        opcodes = self._opcodes
+        argvals = self._argvals
+        # Loop bound is computed once; the original code recomputed
+        # max(instructions_offset.keys()) on every iteration.
+        end = len(opcodes)
+        stack = self._stack
+        locs = self.locals
+        cmp_table = self._CMP
+        pc = self._pc
+        sp = self._sp
+        while pc < end:
+            opcode = opcodes[pc]
+            argval = argvals[pc]
+            pc += 1
+            # The hottest opcodes are inlined to skip the method-call
+            # frame and the self._sp/self._pc round-trips entirely.
+            if opcode == _LOAD_FAST:
+                value = locs.get(argval, _MISSING)
+                if value is _MISSING:
+                    raise UnboundLocalError(f'no variable with name \'{argval}\'')
+                stack[sp] = value
+                sp += 1
+                continue
+            if opcode == _LOAD_CONST:
+                stack[sp] = argval
+                sp += 1
+                continue
+            if opcode == _STORE_FAST:
+                sp -= 1
+                locs[argval] = stack[sp]
+                continue
+            if opcode == _BINARY_ADD:
+                sp -= 1
+                left = stack[sp - 1]
+                right = stack[sp]
+                # PEP 659-style specialization: guard on the exact types
+                # that dominate numeric and string code and take the
+                # concrete slot directly, skipping the full binary-op
+                # protocol.  Under PyPy the guards are traced away.
+                if type(left) is int and type(right) is int:
+                    stack[sp - 1] = int.__add__(left, right)
+                elif type(left) is str and type(right) is str:
+                    stack[sp - 1] = str.__add__(left, right)
+                else:
+                    stack[sp - 1] = left + right
+                continue
+            if opcode == _COMPARE_OP:
+                compare = cmp_table.get(argval)
+                if compare is None:
+                    raise TypeError
+                sp -= 1
+                stack[sp - 1] = compare(stack[sp - 1], stack[sp])
+                continue
+            if opcode == _POP_JUMP_IF_FALSE:
+                sp -= 1
+                if not stack[sp]:
+                    pc = argval
+                continue
+            if opcode == _JUMP_ABSOLUTE:
+                pc = argval
+                continue
+            if opcode == _CALL_FUNCTION:
+                argc = argval
+                sp -= argc + 1
+                f = stack[sp]
+                stack[sp] = f(*stack[sp + 1:sp + 1 + argc])
+                sp += 1
+                continue
+            if opcode == _RETURN_VALUE:
+                sp -= 1
+                self.return_value = stack[sp]
+                break
+            if opcode == _FOR_ITER:
+                try:
+                    value = next(stack[sp - 1])
+                except StopIteration:
+                    sp -= 1
+                    pc = argval
+                else:
+                    stack[sp] = value
+                    sp += 1
+                continue
+            # Second bucket: the whole binary/inplace family, applied to
+            # the local stack state without leaving the loop.
+            binop = _BINARY_FUNCS.get(opcode)
+            if binop is not None:
+                sp -= 1
+                stack[sp - 1] = binop(stack[sp - 1], stack[sp])
+                continue
+            # Long tail: table dispatch; handlers see frame state via
+            # self, so sync the locals across the call.
+            self._pc = pc
+            self._sp = sp
+            handler = dispatch.get(opcode)
+            if handler is None:
+                _resolve_handler(type(self), dis.opname[opcode])(self, argval)
+            else:
+                handler(argval)
+            if self._done:
+                break
+            pc = self._pc
+            sp = self._sp
+        self._pc = pc
+        self._sp = sp
         return self.return_value
 
     # Load, Store, Delete
 
     def load_name_op(self, arg: str) -> None:
-        if arg in self.locals:
-            self.push(self.locals[arg])
-        elif arg in self.globals:
-            self.push(self.globals[arg])
-        elif arg in self.builtins:
-            self.push(self.builtins[arg])
-        else:
-            raise NameError("name \'{arg}\' is not defined")
+        value = self.locals.get(arg, _MISSING)
+        if value is _MISSING:
+            value = self.globals.get(arg, _MISSING)
+        if value is _MISSING:
+            value = self.builtins.get(arg, _MISSING)
+        if value is _MISSING:
+            raise NameError(f"name \'{arg}\' is not defined")
+        self.push(value)
 
     def delete_name_op(self, arg: str) -> None:
         del self.locals[arg]
@@ -90,10 +359,10 @@ class Frame:
         self.locals[arg] = const
 
     def load_fast_op(self, arg: str) -> None:
-        if arg in self.locals:
-            self.push(self.locals[arg])
-        else:
+        value = self.locals.get(arg, _MISSING)
+        if value is _MISSING:
             raise UnboundLocalError(f'no variable with name \'{arg}\'')
+        self.push(value)
 
     def store_fast_op(self, arg: str) -> None:
         self.locals[arg] = self.pop()
@@ -102,12 +371,12 @@ class Frame:
         del self.locals[arg]
 
     def load_global_op(self, arg: str) -> None:
-        if arg in self.globals:
-            self.push(self.globals[arg])
-        elif arg in self.builtins:
-            self.push(self.builtins[arg])
-        else:
-            raise NameError("global name \'{arg}\' is not defined")
+        value = self.globals.get(arg, _MISSING)
+        if value is _MISSING:
+            value = self.builtins.get(arg, _MISSING)
+        if value is _MISSING:
+            raise NameError(f"global name \'{arg}\' is not defined")
+        self.push(value)
 
     def delete_global_op(self, arg: str) -> None:
         del self.globals[arg]
@@ -152,32 +421,26 @@ class Frame:
 
     # Compare
 
+    _CMP: dict[str, tp.Callable[[tp.Any, tp.Any], tp.Any]] = {
+        "==": operator.eq,
+        "!=": operator.ne,
+        ">": operator.gt,
+        "<": operator.lt,
+        ">=": operator.ge,
+        "<=": operator.le,
+        "in": lambda left, right: left in right,
+        "not in": lambda left, right: left not in right,
+        "is": operator.is_,
+        "is not": operator.is_not,
+    }
+
     def compare_op_op(self, op: str) -> None:
         left, right = self.popn(2)
-        result = False
-        if op == "==":
-            result = left == right
-        elif op == "!=":
-            result = left != right
-        elif op == ">":
-            result = left > right
-        elif op == "<":
-            result = left < right
-        elif op == ">=":
-            result = left >= right
-        elif op == "<=":
-            result = left <= right
-        elif op == "in":
-            result = left in right
-        elif op == "not in":
-            result = left not in right
-        elif op == "is":
-            result = left is right
-        elif op == "is not":
-            result = left is not right
-        else:
+        try:
+            compare = self._CMP[op]
+        except KeyError:
             raise TypeError
-        self.push(result)
+        self.push(compare(left, right))
 
     def is_op_op(self, invert: tp.Any) -> None:
         left, right = self.popn(2)
@@ -196,144 +459,36 @@ class Frame:
     # Unary operations
 
     def unary_invert_op(self, _: tp.Any) -> None:
-        self.push(~self.pop())
+        stack = self._stack
+        stack[self._sp - 1] = ~stack[self._sp - 1]
 
     def unary_negative_op(self, _: tp.Any) -> None:
-        self.push(-self.pop())
+        stack = self._stack
+        stack[self._sp - 1] = -stack[self._sp - 1]
 
     def unary_not_op(self, _: tp.Any) -> None:
-        self.push(not self.pop())
+        stack = self._stack
+        stack[self._sp - 1] = not stack[self._sp - 1]
 
     def unary_positive_op(self, _: tp.Any) -> None:
-        self.push(+self.pop())
+        stack = self._stack
+        stack[self._sp - 1] = +stack[self._sp - 1]
 
     def get_iter_op(self, _: tp.Any) -> None:
-        self.push(iter(self.pop()))
-
-    # Binary operations
-
-    def binary_add_op(self, _: tp.Any) -> None:
-        left, right = self.popn(2)
-        self.push(left + right)
-
-    def binary_and_op(self, _: tp.Any) -> None:
-        left, right = self.popn(2)
-        self.push(left & right)
-
-    def binary_floor_divide_op(self, _: tp.Any) -> None:
-        left, right = self.popn(2)
-        self.push(left // right)
-
-    def binary_lshift_op(self, _: tp.Any) -> None:
-        left, right = self.popn(2)
-        self.push(left << right)
-
-    def binary_matrix_multiply_op(self, _: tp.Any) -> None:
-        left, right = self.popn(2)
-        self.push(left @ right)
-
-    def binary_modulo_op(self, _: tp.Any) -> None:
-        left, right = self.popn(2)
-        self.push(left % right)
+        stack = self._stack
+        stack[self._sp - 1] = iter(stack[self._sp - 1])
 
-    def binary_multiply_op(self, _: tp.Any) -> None:
-        left, right = self.popn(2)
-        self.push(left * right)
-
-    def binary_or_op(self, _: tp.Any) -> None:
-        left, right = self.popn(2)
-        self.push(left | right)
-
-    def binary_power_op(self, _: tp.Any) -> None:
-        left, right = self.popn(2)
-        self.push(left ** right)
+    # Binary and inplace operations
 
-    def binary_rshift_op(self, _: tp.Any) -> None:
-        left, right = self.popn(2)
-        self.push(left >> right)
-
-    def binary_subscr_op(self, _: tp.Any) -> None:
-        left, right = self.popn(2)
-        self.push(left[right])
-
-    def binary_subtract_op(self, _: tp.Any) -> None:
-        left, right = self.popn(2)
-        self.push(left - right)
-
-    def binary_true_divide_op(self, _: tp.Any) -> None:
-        left, right = self.popn(2)
-        self.push(left / right)
-
-    def binary_xor_op(self, _: tp.Any) -> None:
-        left, right = self.popn(2)
-        self.push(left ^ right)
-
-    # Inplace operations
-
-    def inplace_add_op(self, _: tp.Any) -> None:
-        left, right = self.popn(2)
-        left += right
-        self.push(left)
-
-    def inplace_and_op(self, _: tp.Any) -> None:
-        left, right = self.popn(2)
-        left &= right
-        self.push(left)
-
-    def inplace_floor_divide_op(self, _: tp.Any) -> None:
-        left, right = self.popn(2)
-        left //= right
-        self.push(left)
-
-    def inplace_lshift_op(self, _: tp.Any) -> None:
-        left, right = self.popn(2)
-        left <<= right
-        self.push(left)
-
-    def inplace_matrix_multiply_op(self, _: tp.Any) -> None:
-        left, right = self.popn(2)
-        left @= right
-        self.push(left)
-
-    def inplace_modulo_op(self, _: tp.Any) -> None:
-        left, right = self.popn(2)
-        left %= right
-        self.push(left)
-
-    def inplace_multiply_op(self, _: tp.Any) -> None:
-        left, right = self.popn(2)
-        left *= right
-        self.push(left)
-
-    def inplace_or_op(self, _: tp.Any) -> None:
-        left, right = self.popn(2)
-        left |= right
-        self.push(left)
-
-    def inplace_power_op(self, _: tp.Any) -> None:
-        left, right = self.popn(2)
-        left **= right
-        self.push(left)
-
-    def inplace_rshift_op(self, _: tp.Any) -> None:
-        left, right = self.popn(2)
-        left >>= right
-        self.push(left)
-
-    def inplace_subtract_op(self, _: tp.Any) -> None:
-        left, right = self.popn(2)
-        left -= right
-        self.push(left)
-
-    def inplace_true_divide_op(self, _: tp.Any) -> None:
-        left, right = self.popn(2)
-        left /= right
-        self.push(left)
-
-    def inplace_xor_op(self, _: tp.Any) -> None:
-        left, right = self.popn(2)
-        left ^= right
-        self.push(left)
+    def _binary_op(self, op: tp.Callable[[tp.Any, tp.Any], tp.Any], _: tp.Any) -> None:
+        """
+        Shared handler for every BINARY_*/INPLACE_* opcode: the concrete
+        operator is bound in the dispatch table built in __init__.
+        """
+        sp = self._sp
+        stack = self._stack
+        stack[sp - 2] = op(stack[sp - 2], stack[sp - 1])
+        self._sp = sp - 1
 
     def store_subscr_op(self, _: tp.Any) -> None:
         val, obj, subscr = self.popn(3)
@@ -374,40 +529,49 @@ class Frame:
         first = self.pop()
         others = self.popn(n - 1)
         self.push(first)
-        for i in others:
-            self.push(i)
+        self.push_many(others)
 
     def rot_two_op(self, _: tp.Any) -> None:
-        self.rot_n_op(2)
+        stack = self._stack
+        sp = self._sp
+        stack[sp - 1], stack[sp - 2] = stack[sp - 2], stack[sp - 1]
 
     def rot_three_op(self, _: tp.Any) -> None:
-        self.rot_n_op(3)
+        stack = self._stack
+        sp = self._sp
+        stack[sp - 1], stack[sp - 2], stack[sp - 3] = \
+            stack[sp - 2], stack[sp - 3], stack[sp - 1]
 
     def rot_four_op(self, _: tp.Any) -> None:
-        self.rot_n_op(4)
+        stack = self._stack
+        sp = self._sp
+        stack[sp - 1], stack[sp - 2], stack[sp - 3], stack[sp - 4] = \
+            stack[sp - 2], stack[sp - 3], stack[sp - 4], stack[sp - 1]
 
     def dup_top_op(self, _: tp.Any) -> None:
-        self.push(self.top())
+        stack = self._stack
+        sp = self._sp
+        stack[sp] = stack[sp - 1]
+        self._sp = sp + 1
 
     def dup_top_two_op(self, _: tp.Any) -> None:
-        for i in self.topn(2):
-            self.push(i)
+        stack = self._stack
+        sp = self._sp
+        stack[sp] = stack[sp - 2]
+        stack[sp + 1] = stack[sp - 1]
+        self._sp = sp + 2
 
     def unpack_sequence_op(self, _: int) -> None:
         tos = self.pop()
-        for elem in reversed(tos):
-            self.push(elem)
+        self.push_many(reversed(tos))
 
     def unpack_ex_op(self, count: int) -> None:
         tos = self.pop()
         lowbyte = count & 0xFF
         highbyte = (count >> 8) & 0xFF
-        for elem in reversed(tos[highbyte + 1:]):
-            self.push(elem)
-        for elem in reversed(tos[lowbyte]):
-            self.push(elem)
-        for elem in reversed(tos[:lowbyte]):
-            self.push(elem)
+        self.push_many(reversed(tos[highbyte + 1:]))
+        self.push_many(reversed(tos[lowbyte]))
+        self.push_many(reversed(tos[:lowbyte]))
 
     def setup_annotations_op(self, _: tp.Any) -> None:
         if not hasattr(self.locals, '__annotations__'):
@@ -575,13 +739,16 @@ class Frame:
 
             # parsed_args: dict[str, tp.Any] = {}
             # parsed_args = self.arg_binding(defaults, kwdefaults, code, *args, **kwargs)
-            parsed_args: dict[str, tp.Any] = {code.co_varnames[i]: args[i] for i in range(code.co_argcount)}
-            f_locals = dict(self.locals)
-            f_locals.update(parsed_args)
+            # The bound arguments are already a fresh dict; a new frame
+            # starts with exactly those locals (copying the caller's
+            # locals in would both be wrong and cost a dict copy per call).
+            f_locals: dict[str, tp.Any] = {code.co_varnames[i]: args[i] for i in range(code.co_argcount)}
 
             frame = Frame(code, self.builtins, self.globals, f_locals)  # Run code in prepared environment
             return frame.run()
 
+        if _is_pure(code):
+            f = _memoized(f)
         self.push(f)
 
     def call_function_op(self, arg: int) -> None:
@@ -592,6 +759,23 @@ class Frame:
         Operation realization:
             https://github.com/python/cpython/blob/3.10/Python/ceval.c#4243
         """
+        # Fast paths for the overwhelmingly common arities: no argument
+        # list is materialized for 0/1/2-argument calls.
+        stack = self._stack
+        sp = self._sp
+        if arg == 0:
+            stack[sp - 1] = stack[sp - 1]()
+            return
+        if arg == 1:
+            sp -= 1
+            stack[sp - 1] = stack[sp - 1](stack[sp])
+            self._sp = sp
+            return
+        if arg == 2:
+            sp -= 2
+            stack[sp - 1] = stack[sp - 1](stack[sp], stack[sp + 1])
+            self._sp = sp
+            return
         args = self.popn(arg)
         f = self.pop()
         self.push(f(*args))
@@ -622,6 +806,24 @@ class Frame:
             self.push(None)
 
     def call_method_op(self, arg: tp.Any) -> None:
+        stack = self._stack
+        sp = self._sp
+        if arg == 0:
+            f = stack[sp - 1]
+            stack[sp - 1] = None if f is None else f()
+            return
+        if arg == 1:
+            sp -= 1
+            f = stack[sp - 1]
+            stack[sp - 1] = None if f is None else f(stack[sp])
+            self._sp = sp
+            return
+        if arg == 2:
+            sp -= 2
+            f = stack[sp - 1]
+            stack[sp - 1] = None if f is None else f(stack[sp], stack[sp + 1])
+            self._sp = sp
+            return
         args = self.popn(arg)
         f = self.pop()
         if f is None:
@@ -638,6 +840,7 @@ class Frame:
             https://github.com/python/cpython/blob/3.10/Python/ceval.c#L2436
         """
         self.return_value = self.pop()
+        self._done = True
 
     # Building
 
@@ -674,37 +877,37 @@ class Frame:
 
     def dict_update_op(self, i: tp.Any) -> None:
         tos = self.pop()
-        dict.update(self.data_stack[-i], tos)
+        dict.update(self._stack[self._sp - i], tos)
 
     def dict_merge_op(self, i: tp.Any) -> None:
         tos = self.pop()
-        if tos in dict(self.data_stack[-i]).keys():
-            dict.update(self.data_stack[-i], tos)
+        if tos in dict(self._stack[self._sp - i]).keys():
+            dict.update(self._stack[self._sp - i], tos)
         else:
             raise ValueError(f'\'{tos}\' exists')
 
     def set_update_op(self, i: tp.Any) -> None:
         tos = self.pop()
-        set.update(self.data_stack[-i], tos)
+        set.update(self._stack[self._sp - i], tos)
 
     def set_add_op(self, i: tp.Any) -> None:
         tos = self.pop()
-        set.add(self.data_stack[-i], tos)
+        set.add(self._stack[self._sp - i], tos)
 
     def list_append_op(self, i: tp.Any) -> None:
         tos = self.pop()
-        list.append(self.data_stack[-i], tos)
+        list.append(self._stack[self._sp - i], tos)
 
     def list_extend_op(self, i: tp.Any) -> None:
         tos = self.pop()
-        list.extend(self.data_stack[-i], tos)
+        list.extend(self._stack[self._sp - i], tos)
 
     def list_to_tuple_op(self, _: tp.Any) -> None:
         self.push(tuple(self.pop()))
 
     def map_add_op(self, i: tp.Any) -> None:
         tos1, tos = self.popn(2)
-        dict.__setitem__(self.data_stack[-i], tos1, tos)
+        dict.__setitem__(self._stack[self._sp - i], tos1, tos)
 
     # Blocks
 
@@ -723,10 +926,10 @@ class Frame:
     # Jumps
 
     def jump_absolute_op(self, target: int) -> None:
-        self.f_lasti = target - 2
+        self._pc = target
 
-    def jump_forward_op(self, delta: int) -> None:
-        self.f_lasti += delta
+    def jump_forward_op(self, target: int) -> None:
+        self._pc = target
 
     def jump_if_false_or_pop_op(self, target: int) -> None:
         if not self.top():
@@ -762,6 +965,23 @@ class Frame:
             self.jump_absolute_op(delta)
 
 
+# Handler resolution hoisted to import time: one walk over dis.opmap
+# resolving names to unbound Frame methods (or the concrete operator for
+# the binary/inplace family), so Frame.__init__ only binds callables
+# instead of repeating string concatenations and attribute lookups for
+# every opcode on every frame.
+_HANDLER_SPECS: list[tuple[int, tp.Any, tp.Any]] = []
+for _opname, _opcode in dis.opmap.items():
+    _binop = _BINARY_OPS.get(_opname)
+    if _binop is not None:
+        _HANDLER_SPECS.append((_opcode, None, _binop))
+        continue
+    _func = getattr(Frame, _opname.lower() + "_op", None)
+    if _func is not None:
+        _HANDLER_SPECS.append((_opcode, _func, None))
+del _opname, _opcode, _binop, _func
+
+
 class VirtualMachine:
     def run(self, code_obj: types.CodeType) -> None:
         """